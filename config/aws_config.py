@@ -38,13 +38,20 @@ class AWSConfig:
             aws_secret_access_key=self.secret_key
         )
     
-    def get_bedrock_client(self):
-        """Get configured Bedrock Runtime client"""
+    def get_bedrock_client(self, config=None, endpoint_url=None):
+        """Get configured Bedrock Runtime client
+        
+        Args:
+            config: Optional botocore Config (connection pool, timeouts, retries)
+            endpoint_url: Optional endpoint override (e.g. a local stub for tests)
+        """
         return boto3.client(
             'bedrock-runtime',
             region_name=self.bedrock_region,
             aws_access_key_id=self.access_key,
-            aws_secret_access_key=self.secret_key
+            aws_secret_access_key=self.secret_key,
+            config=config,
+            endpoint_url=endpoint_url
         )
     
     def get_dynamodb_client(self):
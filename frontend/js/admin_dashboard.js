@@ -98,6 +98,12 @@ async function loadSystemHealth() {
         document.getElementById('llm-memory').textContent = formatBytes(data.llm.memory_usage);
         document.getElementById('llm-inference-time').textContent = data.llm.avg_inference_time ? `${data.llm.avg_inference_time}ms` : '--';
         
+        const latency = data.llm.latency_breakdown || {};
+        document.getElementById('llm-queue-wait').textContent = latency.avg_queue_wait_ms !== undefined ? `${latency.avg_queue_wait_ms}ms` : '--';
+        document.getElementById('llm-retrieval-time').textContent = latency.avg_retrieval_ms !== undefined ? `${(latency.avg_embedding_ms + latency.avg_retrieval_ms).toFixed(1)}ms` : '--';
+        document.getElementById('llm-ttft').textContent = latency.avg_time_to_first_token_ms !== undefined ? `${latency.avg_time_to_first_token_ms}ms (${latency.avg_prompt_tokens} prompt tokens)` : '--';
+        document.getElementById('llm-decode-rate').textContent = latency.avg_decode_tokens_per_second !== undefined ? `${latency.avg_decode_tokens_per_second} tok/s` : '--';
+        
         // System Resources
         const resourcesStatus = data.resources.disk_usage < 80 && data.resources.ram_usage < 80;
         updateStatusBadge('resources-status', resourcesStatus);